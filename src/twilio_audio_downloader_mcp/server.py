@@ -4,31 +4,110 @@ A Model Context Protocol server that downloads audio files from Twilio URLs
 with authentication support and returns them as data streams.
 """
 import argparse
+import asyncio
+import atexit
+import binascii
+import copy
 import os
+import re
+import stat
 import tempfile
+import time
 import requests
-from urllib.parse import urlparse
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import DecodeError, ProtocolError, ReadTimeoutError
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
 from pathlib import Path
-from typing import Optional, Dict, Any
-import traceback
+from functools import cache, lru_cache
+from types import MappingProxyType
+from typing import Optional, Dict, Any, List
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
 import logging
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
 import sys
-import base64
 from fastmcp import FastMCP
 from pydantic import BaseModel
 from pydantic_settings import BaseSettings
 
-# Configure logging
+# Prefer the SIMD-accelerated encoder when available, fall back to stdlib
+try:
+    from pybase64 import b64encode as _b64encode
+except ImportError:
+    def _b64encode(data) -> bytes:
+        # binascii is the C implementation behind base64.b64encode; calling
+        # it directly skips the Python wrapper
+        return binascii.b2a_base64(data, newline=False)
+
+class _DeferredFormatQueueHandler(QueueHandler):
+    """QueueHandler that leaves formatting (including tracebacks) to the listener."""
+
+    def prepare(self, record):
+        # Only merge the message arguments, which may not be safe to format
+        # later; exc_info is kept so the listener's formatter renders it
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+# Configure logging. Records are handed to a background listener through a
+# queue so formatting and console/file I/O stay off the request path.
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_log_handlers = [
+    logging.StreamHandler(sys.stdout),
+    logging.FileHandler('twilio_audio_downloader.log')
+]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+_log_queue = SimpleQueue()
+_log_listener = QueueListener(_log_queue, *_log_handlers, respect_handler_level=True)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+_queue_handler = _DeferredFormatQueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler('twilio_audio_downloader.log')
-    ]
+    handlers=[_queue_handler]
 )
 logger = logging.getLogger(__name__)
 
+# Directory holding base64 payloads spilled to disk (see inline_max_bytes).
+# The name is per user so other local users cannot claim it first.
+SPILL_DIR = Path(tempfile.gettempdir()) / (
+    f"twilio_audio_downloader-{os.getuid()}" if hasattr(os, "getuid") else "twilio_audio_downloader"
+)
+
+# Size of each read from the HTTP response stream
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Payloads larger than this are spooled to disk while downloading
+SPOOL_MAX_SIZE = 4 * 1024 * 1024
+
+# Base64 encoding block size: 57 bytes map to exactly 76 characters, so
+# blocks that are a multiple of 57 bytes never need intermediate padding
+B64_BLOCK_SIZE = 57 * 4096
+
+# Shared HTTP session so repeated downloads reuse pooled keep-alive connections
+http_session = requests.Session()
+_http_adapter = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+)
+http_session.mount("https://", _http_adapter)
+http_session.mount("http://", _http_adapter)
+# Advertise every content coding urllib3 can decode here (gzip and deflate,
+# plus br/zstd when their packages are installed)
+http_session.headers.update(make_headers(accept_encoding=True))
+
+# Number of times an interrupted download is resumed with a Range request
+MAX_RESUME_ATTEMPTS = 3
+
+# Worker threads for blocking downloads, sized to fit within the session pool
+download_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="download")
+
 # Create the MCP server instance
 mcp = FastMCP("Twilio Audio Downloader MCP Server")
 
@@ -45,6 +124,15 @@ class TwilioConfig(BaseSettings):
     twilio_auth_token: str = ""
     twilio_base_url: str = "https://api.twilio.com"
 
+    # Encoded payloads for files larger than this many bytes are written to a
+    # local temporary file and returned by file:// URI instead of inline
+    # (0 disables spilling)
+    inline_max_bytes: int = 0
+
+    # Spilled files older than this many seconds are deleted before each new
+    # spill, keeping disk use bounded
+    spill_max_age_seconds: int = 3600
+
     # Additional authentication for other services
     auth_credentials: Dict[str, str] = {}
 
@@ -54,24 +142,66 @@ class TwilioConfig(BaseSettings):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self._load_auth_from_env()
-
-    def _load_auth_from_env(self):
-        """Load authentication credentials from environment variables."""
-        # Format: AUTH_<IDENTIFIER>=base_url|username:password
-        for key, value in os.environ.items():
-            if key.startswith('AUTH_'):
-                if '|' in value:
-                    base_url_part, auth_part = value.split('|', 1)
-                    if ':' in auth_part:
-                        username, password = auth_part.split(':', 1)
-                        parsed_base = urlparse(base_url_part)
-                        if parsed_base.netloc:
-                            self.auth_credentials[parsed_base.netloc.lower()] = {
-                                'username': username,
-                                'password': password,
-                                'base_url': base_url_part
-                            }
+        self.auth_credentials.update(_parse_auth_env())
+
+        # Register Twilio credentials alongside the others so lookups are a
+        # single dict access
+        if self.twilio_configured and self.twilio_netloc:
+            self.auth_credentials[self.twilio_netloc] = {
+                'username': self.twilio_account_sid,
+                'password': self.twilio_auth_token,
+                'base_url': self.twilio_base_url
+            }
+
+    @property
+    def twilio_configured(self) -> bool:
+        """Whether Twilio account credentials are set."""
+        return bool(self.twilio_account_sid and self.twilio_auth_token)
+
+    @property
+    def twilio_netloc(self) -> str:
+        """Lowercased netloc of the Twilio API base URL."""
+        match = _NETLOC_RE.match(self.twilio_base_url)
+        return match.group(1).lower() if match else ""
+
+    def additional_auth_domains(self) -> list:
+        """Domains with configured credentials, excluding the Twilio API."""
+        if not self.twilio_configured:
+            return list(self.auth_credentials)
+        return [netloc for netloc in self.auth_credentials if netloc != self.twilio_netloc]
+
+# Extracts the netloc from an absolute URL without a full urlparse
+_NETLOC_RE = re.compile(r'^[a-z][a-z0-9+.-]*://([^/?#]+)', re.IGNORECASE)
+
+# Matches a byte Content-Range header, capturing the first byte offset
+_CONTENT_RANGE_RE = re.compile(r'^bytes\s+(\d+)-\d+/(?:\d+|\*)$', re.IGNORECASE)
+
+# Matches supported download URLs, capturing the netloc. The netloc must end
+# at '/', '?', '#' or the end of the URL and may not contain '\' or '@':
+# urllib3 also ends the authority at '\' and takes the host after the last
+# '@', so either would make the host requests connects to differ from the one
+# credentials are looked up for.
+_URL_RE = re.compile(r'^https?://([^/?#\\@]+)(?=[/?#]|$)')
+
+@cache
+def _parse_auth_env() -> Dict[str, Dict[str, str]]:
+    """Load authentication credentials from environment variables (parsed once)."""
+    # Format: AUTH_<IDENTIFIER>=base_url|username:password
+    credentials = {}
+    for key, value in os.environ.items():
+        if key.startswith('AUTH_'):
+            if '|' in value:
+                base_url_part, auth_part = value.split('|', 1)
+                if ':' in auth_part:
+                    username, password = auth_part.split(':', 1)
+                    match = _NETLOC_RE.match(base_url_part)
+                    if match:
+                        credentials[match.group(1).lower()] = {
+                            'username': username,
+                            'password': password,
+                            'base_url': base_url_part
+                        }
+    return credentials
 
 # Global configuration
 config = TwilioConfig()
@@ -80,53 +210,264 @@ class AudioDownloadResponse(BaseModel):
     """Response model for audio download."""
     success: bool
     data: Optional[str] = None  # Base64 encoded audio data
+    data_uri: Optional[str] = None  # file:// URI of base64 data spilled to disk
     filename: str = ""
     content_type: str = ""
     size_bytes: int = 0
     error_message: str = ""
 
+def _success_response(
+    data: Optional[str],
+    data_uri: Optional[str],
+    filename: str,
+    content_type: str,
+    size_bytes: int
+) -> Dict[str, Any]:
+    """Build a successful AudioDownloadResponse as a plain dict, skipping model validation."""
+    return {
+        "success": True,
+        "data": data,
+        "data_uri": data_uri,
+        "filename": filename,
+        "content_type": content_type,
+        "size_bytes": size_bytes,
+        "error_message": ""
+    }
+
+def _error_response(error_message: str) -> Dict[str, Any]:
+    """Build a failed AudioDownloadResponse as a plain dict, skipping model validation."""
+    return {
+        "success": False,
+        "data": None,
+        "data_uri": None,
+        "filename": "",
+        "content_type": "",
+        "size_bytes": 0,
+        "error_message": error_message
+    }
+
+# Map of audio Content-Type values to file extensions
+_EXTENSION_MAP = MappingProxyType({
+    'audio/wav': '.wav',
+    'audio/x-wav': '.wav',
+    'audio/wave': '.wav',
+    'audio/mpeg': '.mp3',
+    'audio/mp3': '.mp3',
+    'audio/mp4': '.m4a',
+    'audio/m4a': '.m4a',
+    'audio/aac': '.aac',
+    'audio/ogg': '.ogg',
+    'audio/flac': '.flac',
+    'audio/webm': '.webm',
+    'audio/3gpp': '.3gp',
+    'audio/amr': '.amr',
+})
+
+@lru_cache(maxsize=128)
 def get_file_extension_from_content_type(content_type: str) -> str:
     """Get appropriate file extension from HTTP Content-Type header."""
     content_type = content_type.lower().split(';')[0].strip()
+    return _EXTENSION_MAP.get(content_type, '.bin')
+
+def _is_twilio_netloc(netloc: str) -> bool:
+    """Whether a (lowercased) netloc belongs to twilio.com or one of its subdomains."""
+    host = netloc.split(':', 1)[0]
+    return host == 'twilio.com' or host.endswith('.twilio.com')
+
+def get_auth_for_netloc(netloc: str) -> Optional[tuple]:
+    """Get authentication credentials for a given (lowercased) URL netloc."""
+    # Userinfo or a backslash means the netloc may not name the host actually
+    # connected to, so never attach credentials
+    if '@' in netloc or '\\' in netloc:
+        return None
 
-    extension_map = {
-        'audio/wav': '.wav',
-        'audio/x-wav': '.wav',
-        'audio/wave': '.wav',
-        'audio/mpeg': '.mp3',
-        'audio/mp3': '.mp3',
-        'audio/mp4': '.m4a',
-        'audio/m4a': '.m4a',
-        'audio/aac': '.aac',
-        'audio/ogg': '.ogg',
-        'audio/flac': '.flac',
-        'audio/webm': '.webm',
-        'audio/3gpp': '.3gp',
-        'audio/amr': '.amr',
-    }
+    cred = config.auth_credentials.get(netloc)
+    if cred is None:
+        # Twilio serves media from hosts other than the API base URL (e.g.
+        # mcs.us1.twilio.com), so fall back to the Twilio credentials there
+        if config.twilio_configured and _is_twilio_netloc(netloc):
+            logger.debug(f"Using Twilio authentication for {netloc}")
+            return (config.twilio_account_sid, config.twilio_auth_token)
+        return None
+
+    logger.debug(f"Using configured authentication for {netloc}")
+    return (cred['username'], cred['password'])
+
+def _open_download(url: str, auth: Optional[tuple], headers: Optional[Dict[str, str]] = None) -> requests.Response:
+    """Issue a streaming GET for url, raising ValueError on request failure."""
+    try:
+        response = http_session.get(url, auth=auth, headers=headers, stream=True, timeout=30)
+        response.raise_for_status()
+    except requests.exceptions.RequestException as e:
+        error_msg = f"HTTP request failed for {url}: {str(e)}"
+        # Traceback is attached as exc_info and rendered by the log listener thread
+        logger.exception(error_msg)
+        raise ValueError(error_msg)
+    return response
+
+def _supports_resume(response: requests.Response) -> bool:
+    """Whether an interrupted response can be continued with a Range request."""
+    # Byte ranges apply to the encoded body, so a compressed stream cannot be
+    # resumed from the count of decoded bytes already written
+    return (
+        (response.status_code == 206 or response.headers.get('accept-ranges', '').lower() == 'bytes')
+        and not response.headers.get('content-encoding')
+    )
 
-    return extension_map.get(content_type, '.bin')
+def _content_range_start(response: requests.Response) -> Optional[int]:
+    """First byte offset of a 206 response's Content-Range, or None if absent/invalid."""
+    match = _CONTENT_RANGE_RE.match(response.headers.get('content-range', ''))
+    return int(match.group(1)) if match else None
+
+def _download_audio(url: str) -> Dict[str, Any]:
+    """Download and base64 encode a single audio file (blocking)."""
+    logger.debug(f"Starting audio download from URL: {url}")
+
+    # A single match both validates the scheme and extracts the netloc
+    url_match = _URL_RE.match(url)
+    if url_match is None:
+        if not url.startswith(('http://', 'https://')):
+            error_msg = "Only HTTP and HTTPS URLs are supported"
+            logger.error(f"{error_msg}. Received URL: {url}")
+            raise ValueError(error_msg)
+        error_msg = f"Invalid URL format: {url}"
+        logger.error(error_msg)
+        raise ValueError(error_msg)
 
-def get_auth_for_url(url: str) -> Optional[tuple]:
-    """Get authentication credentials for a given URL."""
-    parsed = urlparse(url)
-    netloc = parsed.netloc.lower()
+    auth = get_auth_for_netloc(url_match.group(1).lower())
 
-    # Check for Twilio URLs first
-    if 'twilio.com' in netloc and config.twilio_account_sid and config.twilio_auth_token:
-        logger.info("Using Twilio authentication")
-        return (config.twilio_account_sid, config.twilio_auth_token)
+    response = _open_download(url, auth)
 
-    # Check for other configured credentials
-    if netloc in config.auth_credentials:
-        cred = config.auth_credentials[netloc]
-        logger.info(f"Using configured authentication for {netloc}")
-        return (cred['username'], cred['password'])
+    content_type = response.headers.get('content-type', 'application/octet-stream')
+    file_extension = get_file_extension_from_content_type(content_type)
+    url_path = url[url_match.end():].split('?', 1)[0].split('#', 1)[0]
+    filename = f"twilio_audio_{url_path.rsplit('/', 1)[-1]}{file_extension}"
+
+    # Spool the payload to a temporary file (in memory up to SPOOL_MAX_SIZE)
+    # so the raw audio and its base64 encoding are not both held in full.
+    with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE) as audio_file:
+        bytes_downloaded = 0
+        resume_attempts = 0
+        while True:
+            try:
+                with closing(response):
+                    # Read the underlying stream directly in large chunks rather
+                    # than going through iter_content's per-chunk generator
+                    response.raw.decode_content = True
+                    while chunk := response.raw.read(DOWNLOAD_CHUNK_SIZE):
+                        audio_file.write(chunk)
+                        bytes_downloaded += len(chunk)
+                break
+            except DecodeError as e:
+                error_msg = f"Could not decode the response body for {url}: {str(e)}"
+                logger.exception(error_msg)
+                raise ValueError(error_msg)
+            except (ProtocolError, ReadTimeoutError) as e:
+                if resume_attempts >= MAX_RESUME_ATTEMPTS or not _supports_resume(response):
+                    error_msg = f"Download interrupted for {url}: {str(e)}"
+                    logger.exception(error_msg)
+                    raise ValueError(error_msg)
+
+                # Continue from where the stream broke off. If-Range makes the
+                # server send the whole file (200) if it changed in between.
+                resume_attempts += 1
+                logger.warning(
+                    f"Download interrupted after {bytes_downloaded} bytes, "
+                    f"resuming (attempt {resume_attempts}/{MAX_RESUME_ATTEMPTS})"
+                )
+                # Ask for the range without content coding, since byte offsets
+                # into a compressed body do not line up with bytes_downloaded
+                resume_headers = {
+                    "Range": f"bytes={bytes_downloaded}-",
+                    "Accept-Encoding": "identity"
+                }
+                validator = response.headers.get('etag') or response.headers.get('last-modified')
+                if validator:
+                    resume_headers["If-Range"] = validator
+                response = _open_download(url, auth, resume_headers)
+                if (
+                    response.status_code != 206
+                    or response.headers.get('content-encoding')
+                    or _content_range_start(response) != bytes_downloaded
+                ):
+                    response.close()
+                    error_msg = f"Server did not resume the interrupted download for {url}"
+                    logger.error(error_msg)
+                    raise ValueError(error_msg)
+
+        if bytes_downloaded == 0:
+            error_msg = "Downloaded file is empty"
+            logger.error(error_msg)
+            raise ValueError(error_msg)
+
+        logger.debug(f"Successfully downloaded {bytes_downloaded} bytes")
+
+        audio_file.seek(0)
+        if config.inline_max_bytes and bytes_downloaded > config.inline_max_bytes:
+            encoded_data = None
+            data_uri = _spill_base64(audio_file)
+            logger.debug(f"Wrote base64 data for {bytes_downloaded} bytes to {data_uri}")
+        else:
+            encoded_data = _encode_base64(audio_file, bytes_downloaded)
+            data_uri = None
+
+    return _success_response(encoded_data, data_uri, filename, content_type, bytes_downloaded)
+
+def _encode_base64(audio_file, size: int) -> str:
+    """Base64 encode the remainder of a file of known size into a string."""
+    # Encode audio data as base64 for JSON transport. MCP tool results are
+    # JSON-RPC messages, so binary data cannot be returned as raw bytes.
+    # Blocks are a multiple of 3 bytes, so only the final block can produce
+    # padding and the concatenated output equals encoding the whole payload
+    # at once. The output buffer is sized up front to avoid regrowth.
+    encoded = bytearray(4 * ((size + 2) // 3))
+    offset = 0
+    while block := audio_file.read(B64_BLOCK_SIZE):
+        encoded_block = _b64encode(block)
+        encoded[offset:offset + len(encoded_block)] = encoded_block
+        offset += len(encoded_block)
+    return encoded.decode('ascii')
+
+def _prune_spill_dir(max_age_seconds: int) -> None:
+    """Delete spilled base64 files older than max_age_seconds."""
+    cutoff = time.time() - max_age_seconds
+    for path in SPILL_DIR.glob("twilio_audio_*.b64"):
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+        except OSError:
+            # Already removed by a concurrent prune, or not ours to remove
+            pass
+
+def _ensure_spill_dir() -> None:
+    """Create SPILL_DIR if needed and check that only the current user can access it."""
+    SPILL_DIR.mkdir(mode=0o700, exist_ok=True)
+    if not hasattr(os, "getuid"):
+        return
+    # exist_ok accepts a directory created by someone else, and mkdir's mode
+    # is not applied to an existing directory, so verify both explicitly
+    # (lstat so a symlink planted under the name is not followed)
+    st = SPILL_DIR.lstat()
+    if not stat.S_ISDIR(st.st_mode) or st.st_uid != os.getuid() or stat.S_IMODE(st.st_mode) != 0o700:
+        error_msg = f"Spill directory {SPILL_DIR} must be a directory owned by the current user with mode 0700"
+        logger.error(error_msg)
+        raise ValueError(error_msg)
 
-    return None
+def _spill_base64(audio_file) -> str:
+    """Base64 encode the remainder of a file into a spill file and return its URI."""
+    # The file is left in place for the client to read and removed by a later
+    # prune once it is older than spill_max_age_seconds.
+    _ensure_spill_dir()
+    _prune_spill_dir(config.spill_max_age_seconds)
+    with tempfile.NamedTemporaryFile(
+        dir=SPILL_DIR, prefix="twilio_audio_", suffix=".b64", delete=False
+    ) as encoded_file:
+        while block := audio_file.read(B64_BLOCK_SIZE):
+            encoded_file.write(_b64encode(block))
+    return Path(encoded_file.name).as_uri()
 
 @mcp.tool()
-def download_twilio_audio(url: str) -> Dict[str, Any]:
+async def download_twilio_audio(url: str) -> Dict[str, Any]:
     """
     Download audio file from Twilio URL with authentication support and return as base64 encoded data.
 
@@ -134,61 +475,39 @@ def download_twilio_audio(url: str) -> Dict[str, Any]:
         url: The URL of the audio file to download
 
     Returns:
-        Dictionary containing success status, base64 encoded audio data, filename, content type, and size
+        Dictionary containing success status, base64 encoded audio data, filename, content type, and size.
+        When the file exceeds the configured inline limit, "data" is null and "data_uri"
+        points to a local file holding the base64 encoded data instead.
 
     Raises:
         ValueError: If the URL is invalid or the download fails
     """
-    logger.info(f"Starting audio download from URL: {url}")
-
-    if not url.startswith(('http://', 'https://')):
-        error_msg = "Only HTTP and HTTPS URLs are supported"
-        logger.error(f"{error_msg}. Received URL: {url}")
-        raise ValueError(error_msg)
-
-    parsed_url = urlparse(url)
-    if not parsed_url.netloc:
-        error_msg = f"Invalid URL format: {url}"
-        logger.error(error_msg)
-        raise ValueError(error_msg)
+    # Run the blocking download in a worker thread so concurrent tool calls
+    # are not serialized on the event loop
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(download_executor, _download_audio, url)
 
-    auth = get_auth_for_url(url)
-
-    try:
-        response = requests.get(url, auth=auth, stream=True, timeout=30)
-        response.raise_for_status()
-    except requests.exceptions.RequestException as e:
-        error_msg = f"HTTP request failed for {url}: {str(e)}"
-        logger.error(error_msg)
-        logger.error(f"Full traceback: {traceback.format_exc()}")
-        raise ValueError(error_msg)
-
-    content_type = response.headers.get('content-type', 'application/octet-stream')
-    file_extension = get_file_extension_from_content_type(content_type)
-    filename = f"twilio_audio_{parsed_url.path.split('/')[-1]}{file_extension}"
-
-    audio_data = b""
-    for chunk in response.iter_content(chunk_size=8192):
-        if chunk:
-            audio_data += chunk
-
-    if len(audio_data) == 0:
-        error_msg = "Downloaded file is empty"
-        logger.error(error_msg)
-        raise ValueError(error_msg)
-
-    logger.info(f"Successfully downloaded {len(audio_data)} bytes")
+@mcp.tool()
+async def download_twilio_audios(urls: List[str]) -> List[Dict[str, Any]]:
+    """
+    Download several audio files concurrently and return each as base64 encoded data.
 
-    # Encode audio data as base64 for JSON transport
-    encoded_data = base64.b64encode(audio_data).decode('utf-8')
+    Args:
+        urls: The URLs of the audio files to download
 
-    return {
-        "success": True,
-        "data": encoded_data,
-        "filename": filename,
-        "content_type": content_type,
-        "size_bytes": len(audio_data)
-    }
+    Returns:
+        List of dictionaries in the same order as urls, each shaped like the result of
+        download_twilio_audio. Failed downloads have success set to false and an error_message.
+    """
+    loop = asyncio.get_running_loop()
+    results = await asyncio.gather(
+        *(loop.run_in_executor(download_executor, _download_audio, url) for url in urls),
+        return_exceptions=True
+    )
+    return [
+        _error_response(str(result)) if isinstance(result, Exception) else result
+        for result in results
+    ]
 
 @mcp.tool()
 def get_server_config() -> Dict[str, Any]:
@@ -204,8 +523,10 @@ def get_server_config() -> Dict[str, Any]:
         "host": config.host,
         "port": config.port,
         "log_level": config.log_level,
-        "twilio_configured": bool(config.twilio_account_sid and config.twilio_auth_token),
-        "additional_auth_domains": list(config.auth_credentials.keys()),
+        "inline_max_bytes": config.inline_max_bytes,
+        "spill_max_age_seconds": config.spill_max_age_seconds,
+        "twilio_configured": config.twilio_configured,
+        "additional_auth_domains": config.additional_auth_domains(),
         "supported_protocols": ["http", "https"],
         "supported_audio_formats": ["wav", "mp3", "m4a", "aac", "ogg", "flac", "webm", "3gp", "amr"]
     }
@@ -224,7 +545,7 @@ def setup_health_endpoint():
                 "service": "Twilio Audio Downloader MCP Server",
                 "version": "0.1.0",
                 "timestamp": datetime.utcnow().isoformat() + "Z",
-                "tools": ["download_twilio_audio", "get_server_config"]
+                "tools": ["download_twilio_audio", "download_twilio_audios", "get_server_config"]
             }
 
         logger.info("Health check endpoint configured at /health")
@@ -258,13 +579,14 @@ def main():
     print(f"Starting Twilio Audio Downloader MCP Server on http://{args.host}:{args.port}")
     print(f"MCP endpoint will be available at: http://{args.host}:{args.port}/mcp")
 
-    if config.twilio_account_sid and config.twilio_auth_token:
+    if config.twilio_configured:
         print("✓ Twilio authentication configured")
     else:
         print("⚠ Twilio authentication not configured - set TWILIO_ACCOUNT_SID and TWILIO_AUTH_TOKEN")
 
-    if config.auth_credentials:
-        print(f"✓ Additional authentication configured for: {', '.join(config.auth_credentials.keys())}")
+    additional_auth_domains = config.additional_auth_domains()
+    if additional_auth_domains:
+        print(f"✓ Additional authentication configured for: {', '.join(additional_auth_domains)}")
 
     import uvicorn
 